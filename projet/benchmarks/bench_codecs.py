@@ -0,0 +1,121 @@
+"""Benchmark de débit de la sérialisation des alertes.
+
+Compare les chemins de ``SQLiteStore`` avant/après (métadonnées, lecture
+des lignes) et mesure les codecs JSON/msgpack.
+
+Usage:
+    python -m benchmarks.bench_codecs [nombre_alertes]
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from karukera_alertes.models import AlertSource, EarthquakeAlert, Location
+from karukera_alertes.storage import SQLiteStore
+from karukera_alertes.storage.codecs import CODECS, dumps, get_codec
+from karukera_alertes.storage.sqlite_store import _fetch_dicts
+
+
+def make_alerts(n: int) -> list[EarthquakeAlert]:
+    now = datetime.utcnow()
+    return [
+        EarthquakeAlert(
+            title=f"Séisme M{2 + i % 5}.{i % 10} - Caraïbes",
+            description="Benchmark",
+            source=AlertSource(name="USGS", url="https://earthquake.usgs.gov"),
+            location=Location(latitude=16.25, longitude=-61.55, communes=["Basse-Terre"]),
+            created_at=now - timedelta(minutes=i),
+            magnitude=2 + (i % 50) / 10,
+            depth_km=10 + i % 30,
+            felt_reports=i % 7,
+            metadata={
+                "event_id": f"us{i:08d}",
+                "net": "us",
+                "updated": 1701350400000,
+                "sources": [1, 2],
+            },
+        )
+        for i in range(n)
+    ]
+
+
+def bench(label: str, func, n: int, repeat: int = 5) -> None:
+    best = min(_timed(func) for _ in range(repeat))
+    print(f"{label:<36} {n / best:>12,.0f} alertes/s")
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_metadata(alerts: list[EarthquakeAlert]) -> None:
+    """Sérialisation des métadonnées dans ``SQLiteStore.save()``."""
+    n = len(alerts)
+    bench("metadata json.dumps (avant)", lambda: [json.dumps(a.metadata) for a in alerts], n)
+    bench("metadata dumps (après)", lambda: [dumps(a.metadata) for a in alerts], n)
+
+
+def bench_sqlite_rows(alerts: list[EarthquakeAlert]) -> None:
+    """Construction des dicts à la lecture (``get_active``)."""
+    n = len(alerts)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(Path(tmp) / "bench.db")
+        with store._get_connection() as conn:
+            conn.executemany(store.INSERT, [store._to_row(alert) for alert in alerts])
+
+        def read_rows() -> list[sqlite3.Row]:
+            with store._get_connection() as conn:
+                return conn.execute("SELECT * FROM alerts").fetchall()
+
+        def fetch_dicts() -> list[dict]:
+            with store._get_connection() as conn:
+                return _fetch_dicts(conn.execute("SELECT * FROM alerts"))
+
+        bench("lecture dict(sqlite3.Row) (avant)", lambda: [dict(row) for row in read_rows()], n)
+        bench("lecture _fetch_dicts (après)", fetch_dicts, n)
+
+
+def bench_codec(codec, alerts: list[EarthquakeAlert]) -> None:
+    n = len(alerts)
+    encoded = [codec.encode(alert) for alert in alerts]
+    batch = codec.encode_many(alerts)
+    bench(f"{codec.name} encode", lambda: [codec.encode(alert) for alert in alerts], n)
+    bench(f"{codec.name} decode", lambda: [codec.decode(data) for data in encoded], n)
+    bench(f"{codec.name} encode_many", lambda: codec.encode_many(alerts), n)
+    bench(f"{codec.name} decode_many", lambda: codec.decode_many(batch), n)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    alerts = make_alerts(n)
+
+    bench_metadata(alerts)
+    bench_sqlite_rows(alerts)
+
+    # Référence : (dé)sérialisation JSON native de Pydantic, même contenu
+    payloads = [alert.model_dump_json() for alert in alerts]
+    bench("pydantic model_dump_json", lambda: [a.model_dump_json() for a in alerts], n)
+    bench(
+        "pydantic model_validate_json",
+        lambda: [EarthquakeAlert.model_validate_json(p) for p in payloads],
+        n,
+    )
+
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError as e:
+            print(f"{name:<36} ignoré ({e})")
+            continue
+        bench_codec(codec, alerts)
+
+
+if __name__ == "__main__":
+    main()
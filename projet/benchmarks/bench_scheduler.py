@@ -0,0 +1,152 @@
+"""Simulation : planification fixe vs adaptative des collecteurs.
+
+Rejoue 30 jours d'activité sismique synthétique (bruit de fond et essaims)
+sur une horloge virtuelle, via la boucle de production
+(``AdaptiveScheduler.run_once``), et compare le nombre de requêtes, le
+volume d'événements transférés et la latence de détection des séismes
+significatifs (M4+).
+
+Usage:
+    python -m benchmarks.bench_scheduler [graine]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+from datetime import datetime, timedelta
+
+from karukera_alertes.collectors import AdaptiveScheduler, BaseCollector
+from karukera_alertes.models import AlertSource, EarthquakeAlert, Location, Severity
+
+START = datetime(2026, 1, 1)
+DURATION = timedelta(days=30)
+DAYS_BACK = timedelta(days=7)
+
+
+class VirtualClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class SimulatedCollector(BaseCollector):
+    """Collecteur rejouant des événements pré-générés (réponse USGS simulée)."""
+
+    supports_incremental = True
+
+    def __init__(self, name: str, events: list[EarthquakeAlert], clock: VirtualClock):
+        self._name = name
+        super().__init__()
+        self.events = events
+        self.clock = clock
+        self.updated_after: datetime | None = None
+        self.transferred = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def source_url(self) -> str:
+        return "sim://usgs"
+
+    async def collect(self):
+        now = self.clock()
+        since = now - DAYS_BACK
+        if self.incremental and self.updated_after:
+            since = max(since, self.updated_after)
+        response = [e for e in self.events if since <= e.created_at <= now]
+        self.updated_after = now
+        self.transferred += len(response)
+        for event in response:
+            yield event
+
+
+def make_event(when: datetime, magnitude: float, i: int) -> EarthquakeAlert:
+    return EarthquakeAlert(
+        title=f"Séisme M{magnitude:.1f}",
+        source=AlertSource(name="USGS", url=f"sim://event/{i}"),
+        location=Location(latitude=16.25, longitude=-61.55),
+        created_at=when,
+        magnitude=magnitude,
+        depth_km=10,
+    )
+
+
+def generate_events(rng: random.Random) -> list[EarthquakeAlert]:
+    events = []
+    # Bruit de fond : ~3 petits séismes par jour
+    t = START
+    while t < START + DURATION:
+        t += timedelta(hours=rng.expovariate(3 / 24))
+        events.append((t, rng.uniform(2.0, 3.8)))
+    # Séismes significatifs isolés, sans précurseur
+    for _ in range(3):
+        events.append((START + timedelta(hours=rng.uniform(24, 29 * 24)), rng.uniform(4.0, 5.5)))
+    # Essaims : précurseurs, choc principal, répliques
+    for _ in range(4):
+        t = START + timedelta(hours=rng.uniform(24, 28 * 24))
+        for _ in range(rng.randint(3, 8)):
+            t += timedelta(minutes=rng.expovariate(1 / 20))
+            events.append((t, rng.uniform(2.5, 3.9)))
+        for _ in range(rng.randint(2, 5)):
+            t += timedelta(minutes=rng.expovariate(1 / 15))
+            events.append((t, rng.uniform(4.0, 6.0)))
+        for _ in range(rng.randint(10, 30)):
+            t += timedelta(minutes=rng.expovariate(1 / 30))
+            events.append((t, rng.uniform(2.5, 4.8)))
+    events.sort()
+    return [make_event(when, mag, i) for i, (when, mag) in enumerate(events)]
+
+
+async def simulate(
+    label: str,
+    events: list[EarthquakeAlert],
+    incremental: bool,
+    **intervals: float,
+) -> None:
+    clock = VirtualClock(START)
+    collector = SimulatedCollector(label, events, clock)
+    scheduler = AdaptiveScheduler(
+        [collector], clock=clock, incremental=incremental, **intervals
+    )
+    detected: dict[str, datetime] = {}
+    requests = 0
+    while clock.now < START + DURATION:
+        requests += len(scheduler.due())
+        for alert in await scheduler.run_once():
+            detected.setdefault(alert.source.url, clock.now)
+        clock.now += timedelta(seconds=scheduler.next_delay())
+
+    latencies = [
+        (detected[e.source.url] - e.created_at).total_seconds()
+        for e in events
+        if e.severity != Severity.INFO and e.source.url in detected
+    ]
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:<22} requêtes={requests:>6}  événements={collector.transferred:>9}  "
+        f"latence M4+ moy={statistics.mean(latencies):>4.0f}s "
+        f"p95={p95:>4.0f}s max={max(latencies):>4.0f}s"
+    )
+
+
+async def main() -> None:
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else 42
+    events = generate_events(random.Random(seed))
+    print(f"{len(events)} événements sur {DURATION.days} jours (graine {seed})")
+    fixed = {"min_interval": 300, "max_interval": 300, "default_interval": 300}
+    fast = {"min_interval": 60, "max_interval": 60, "default_interval": 60}
+    await simulate("fixe 300s", events, incremental=False, **fixed)
+    # Témoin : part de la réduction due à updatedafter seul
+    await simulate("fixe 300s incrémental", events, incremental=True, **fixed)
+    await simulate("fixe 60s", events, incremental=False, **fast)
+    await simulate("adaptatif complet", events, incremental=False)
+    await simulate("adaptatif incrémental", events, incremental=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,11 +1,20 @@
 """Export des collecteurs."""
 
-from .base import BaseCollector, CollectorError
+from .base import BaseCollector, CollectorError, CircuitOpenError
+from .circuit_breaker import CircuitBreaker, CircuitState, breaker_stats, get_breaker
 from .earthquake import EarthquakeCollector, collect_earthquakes
+from .scheduler import AdaptiveScheduler, SourceSchedule
 
 __all__ = [
     "BaseCollector",
     "CollectorError",
+    "CircuitOpenError",
+    "CircuitBreaker",
+    "CircuitState",
+    "breaker_stats",
+    "get_breaker",
     "EarthquakeCollector",
     "collect_earthquakes",
+    "AdaptiveScheduler",
+    "SourceSchedule",
 ]
@@ -9,6 +9,8 @@ import httpx
 from karukera_alertes.models import BaseAlert
 from karukera_alertes.config import settings
 
+from .circuit_breaker import CircuitBreaker, get_breaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,9 +19,19 @@ class CollectorError(Exception):
     pass
 
 
+class CircuitOpenError(CollectorError):
+    """Source court-circuitée (disjoncteur ouvert)."""
+    pass
+
+
 class BaseCollector(ABC):
     """Classe abstraite pour tous les collecteurs."""
 
+    # Réponses incrémentales possibles (attribut ``incremental``), à activer
+    # par un appelant qui conserve l'état entre deux collectes
+    supports_incremental = False
+    incremental = False
+
     def __init__(self, config: dict[str, Any] | None = None):
         self.config = config or {}
         self.last_collection: datetime | None = None
@@ -37,6 +49,11 @@ class BaseCollector(ABC):
         """URL de la source."""
         pass
 
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Disjoncteur partagé de la source."""
+        return get_breaker(self.name)
+
     @property
     def alert_type(self) -> str:
         """Type d'alerte produit."""
@@ -48,23 +65,46 @@ class BaseCollector(ABC):
         pass
 
     async def is_available(self) -> bool:
-        """Vérifie la disponibilité de la source."""
+        """Vérifie la disponibilité de la source (résultat mis en cache)."""
+        breaker = self.breaker
+        cached = breaker.cached_probe()
+        if cached is not None:
+            return cached
+        if not breaker.allow_request():
+            return False
         try:
             async with httpx.AsyncClient(timeout=10) as client:
                 response = await client.head(self.source_url)
-                return response.status_code < 500
+                available = response.status_code < 500
         except Exception:
-            return False
+            available = False
+        finally:
+            # Annulation : l'essai semi-ouvert ne doit pas rester bloqué
+            breaker.release_trial()
+        if available:
+            breaker.record_probe_success()
+        else:
+            breaker.record_failure()
+        breaker.store_probe(available)
+        return available
 
     async def collect_all(self) -> list[BaseAlert]:
         """Collecte toutes les alertes en liste."""
         alerts = []
+        breaker = self.breaker
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Source {self.name} indisponible (circuit ouvert)")
         try:
             async for alert in self.collect():
                 alerts.append(alert)
             self.last_collection = datetime.utcnow()
             self._logger.info(f"Collecté {len(alerts)} alertes depuis {self.name}")
         except Exception as e:
+            breaker.record_failure()
             self._logger.error(f"Erreur collecte {self.name}: {e}")
             raise CollectorError(f"Échec collecte {self.name}: {e}")
+        finally:
+            # Annulation : l'essai semi-ouvert ne doit pas rester bloqué
+            breaker.release_trial()
+        breaker.record_success()
         return alerts
@@ -0,0 +1,155 @@
+"""Disjoncteur (circuit breaker) par source de collecte."""
+
+import logging
+import time
+from enum import Enum
+from typing import Any, Callable
+
+from karukera_alertes.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """États du disjoncteur."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Disjoncteur d'une source, avec cache du dernier test de disponibilité.
+
+    Après ``failure_threshold`` échecs consécutifs le circuit s'ouvre : les
+    appels sont refusés pendant ``cooldown`` secondes, puis un seul appel
+    d'essai est autorisé (semi-ouvert). Son succès referme le circuit, son
+    échec le rouvre. Un test de disponibilité réussi peut refermer un
+    circuit semi-ouvert, mais n'efface pas les échecs de collecte d'un
+    circuit fermé (une source peut répondre au HEAD et échouer au GET).
+    Un essai interrompu (annulation) ou sans réponse depuis
+    plus de ``cooldown`` secondes libère la place pour un nouvel essai.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        cooldown: float | None = None,
+        probe_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = (
+            failure_threshold if failure_threshold is not None
+            else settings.circuit_failure_threshold
+        )
+        if self.failure_threshold < 1:
+            raise ValueError(f"failure_threshold doit être >= 1: {self.failure_threshold}")
+        self.cooldown = cooldown if cooldown is not None else settings.circuit_cooldown
+        self.probe_ttl = probe_ttl if probe_ttl is not None else settings.circuit_probe_ttl
+        self.clock = clock
+        self._state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: float | None = None
+        self._trial_started: float | None = None
+        self._probe: tuple[float, bool] | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """État courant (passe en semi-ouvert à la fin du délai)."""
+        if (
+            self._state == CircuitState.OPEN
+            and self.opened_at is not None
+            and self.clock() - self.opened_at >= self.cooldown
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_started = None
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Indique si un appel vers la source est autorisé."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            now = self.clock()
+            if self._trial_started is None or now - self._trial_started >= self.cooldown:
+                self._trial_started = now
+                return True
+        return False
+
+    def release_trial(self) -> None:
+        """Libère l'essai en cours sans conclure (appel annulé)."""
+        self._trial_started = None
+
+    def record_success(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"Circuit {self.name} refermé")
+        self._state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_started = None
+
+    def record_probe_success(self) -> None:
+        """Test de disponibilité réussi : referme seulement un circuit semi-ouvert."""
+        if self.state == CircuitState.HALF_OPEN:
+            self.record_success()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        if self._state != CircuitState.OPEN:
+            self.trips += 1
+            logger.warning(f"Circuit {self.name} ouvert après {self.failures} échec(s)")
+        self._state = CircuitState.OPEN
+        self.opened_at = self.clock()
+        self._trial_started = None
+        self._probe = None
+
+    def cached_probe(self) -> bool | None:
+        """Dernier résultat de disponibilité s'il est encore valide."""
+        if self._probe is None:
+            return None
+        checked_at, available = self._probe
+        if self.clock() - checked_at > self.probe_ttl:
+            return None
+        return available
+
+    def store_probe(self, available: bool) -> None:
+        self._probe = (self.clock(), available)
+
+    def reset(self) -> None:
+        """Réinitialise le disjoncteur (état fermé, compteurs à zéro)."""
+        self.record_success()
+        self.trips = 0
+        self._probe = None
+
+    def stats(self) -> dict[str, Any]:
+        """État et compteurs pour la supervision."""
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "failures": self.failures,
+            "trips": self.trips,
+            "failure_threshold": self.failure_threshold,
+            "cooldown": self.cooldown,
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Disjoncteur partagé d'une source (un par nom de collecteur)."""
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
+
+
+def breaker_stats() -> dict[str, dict[str, Any]]:
+    """État de tous les disjoncteurs connus."""
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
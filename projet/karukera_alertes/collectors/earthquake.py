@@ -12,6 +12,8 @@ from karukera_alertes.config import settings
 class EarthquakeCollector(BaseCollector):
     """Collecteur de séismes depuis USGS."""
 
+    supports_incremental = True
+
     @property
     def name(self) -> str:
         return "USGS Earthquake"
@@ -30,16 +32,22 @@ class EarthquakeCollector(BaseCollector):
         min_magnitude: float | None = None,
         max_radius_km: int | None = None,
         days_back: int = 7,
+        incremental: bool = False,
     ):
         super().__init__(config)
         self.min_magnitude = min_magnitude or settings.usgs_min_magnitude
         self.max_radius_km = max_radius_km or settings.usgs_search_radius_km
         self.days_back = days_back
+        # En incrémental, seuls les événements mis à jour depuis la
+        # dernière requête réussie sont demandés (paramètre updatedafter) :
+        # collect() ne renvoie plus toute la fenêtre days_back.
+        self.incremental = incremental
+        self.updated_after: datetime | None = None
 
     def _build_params(self) -> dict[str, Any]:
         """Paramètres de requête USGS."""
         start_time = datetime.utcnow() - timedelta(days=self.days_back)
-        return {
+        params = {
             "format": "geojson",
             "latitude": settings.guadeloupe_latitude,
             "longitude": settings.guadeloupe_longitude,
@@ -48,10 +56,18 @@ class EarthquakeCollector(BaseCollector):
             "starttime": start_time.strftime("%Y-%m-%d"),
             "orderby": "time",
         }
+        if self.incremental and self.updated_after:
+            params["updatedafter"] = self.updated_after.strftime("%Y-%m-%dT%H:%M:%S")
+        return params
 
     async def collect(self) -> AsyncIterator[EarthquakeAlert]:
-        """Collecte les séismes."""
+        """Collecte les séismes des ``days_back`` derniers jours.
+
+        En mode incrémental, seuls ceux mis à jour depuis la dernière
+        collecte réussie.
+        """
         params = self._build_params()
+        query_time = datetime.utcnow()
 
         try:
             async with httpx.AsyncClient(timeout=settings.collector_timeout) as client:
@@ -60,6 +76,7 @@ class EarthquakeCollector(BaseCollector):
                 data = response.json()
         except httpx.HTTPError as e:
             raise CollectorError(f"Erreur API USGS: {e}")
+        self.updated_after = query_time
 
         for feature in data.get("features", []):
             try:
@@ -0,0 +1,194 @@
+"""Planification adaptative des collecteurs."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
+
+from karukera_alertes.models import BaseAlert, Severity
+from karukera_alertes.config import settings
+
+from .base import BaseCollector, CollectorError
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_ORDER = list(Severity)
+
+
+@dataclass
+class SourceSchedule:
+    """État de planification d'une source."""
+
+    collector: BaseCollector
+    interval: float
+    next_run: datetime
+    seen: set[tuple[str, datetime]] = field(default_factory=set)
+    hot_until: datetime | None = None
+    polls: int = 0
+
+
+class AdaptiveScheduler:
+    """Adapte l'intervalle de collecte de chaque source à l'activité.
+
+    - alerte récente de sévérité >= seuil (ou alerte tsunami) : intervalle
+      minimal tant qu'elle reste dans la fenêtre ``recent_window`` ;
+    - nouvelles alertes moins graves : l'intervalle repasse sous l'intervalle
+      par défaut (divisé par le facteur) ;
+    - réponse vide, inchangée ou en erreur : recul exponentiel jusqu'au maximum.
+
+    Le maximum borne la latence de détection d'une source calme : c'est le
+    compromis entre requêtes économisées et séisme isolé, sans précurseur,
+    détecté plus tard (voir ``benchmarks/bench_scheduler.py``).
+
+    Avec ``incremental``, les collecteurs qui le permettent ne renvoient que
+    les événements modifiés depuis leur dernière collecte : le planificateur
+    conserve les événements déjà vus et l'état « actif » entre deux passages.
+    """
+
+    def __init__(
+        self,
+        collectors: Iterable[BaseCollector] = (),
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+        default_interval: float | None = None,
+        backoff_factor: float | None = None,
+        recent_window: float | None = None,
+        severity_threshold: Severity | str | None = None,
+        incremental: bool = True,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.min_interval = min_interval or settings.scheduler_min_interval
+        self.max_interval = max_interval or settings.scheduler_max_interval
+        self.default_interval = default_interval or settings.scheduler_default_interval
+        self.backoff_factor = backoff_factor or settings.scheduler_backoff_factor
+        self.recent_window = timedelta(
+            seconds=recent_window or settings.scheduler_recent_window
+        )
+        self.severity_threshold = Severity(
+            severity_threshold or settings.scheduler_severity_threshold
+        )
+        self.incremental = incremental
+        self.clock = clock
+        self._sources: dict[str, SourceSchedule] = {}
+        for collector in collectors:
+            self.add(collector)
+
+    def add(self, collector: BaseCollector) -> None:
+        """Ajoute un collecteur, planifié immédiatement."""
+        if self.incremental and collector.supports_incremental:
+            collector.incremental = True
+        self._sources[collector.name] = SourceSchedule(
+            collector=collector,
+            interval=self._clamp(self.default_interval),
+            next_run=self.clock(),
+        )
+
+    def interval(self, name: str) -> float:
+        """Intervalle courant (secondes) d'une source."""
+        return self._sources[name].interval
+
+    def intervals(self) -> dict[str, float]:
+        """Intervalles courants de toutes les sources."""
+        return {name: state.interval for name, state in self._sources.items()}
+
+    def due(self, now: datetime | None = None) -> list[BaseCollector]:
+        """Collecteurs à exécuter maintenant."""
+        now = now or self.clock()
+        return [s.collector for s in self._sources.values() if s.next_run <= now]
+
+    def next_delay(self, now: datetime | None = None) -> float:
+        """Secondes avant la prochaine collecte."""
+        if not self._sources:
+            return self.max_interval
+        now = now or self.clock()
+        next_run = min(s.next_run for s in self._sources.values())
+        return max(0.0, (next_run - now).total_seconds())
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    @staticmethod
+    def _alert_key(alert: BaseAlert) -> tuple[str, datetime]:
+        # Les identifiants sont régénérés à chaque collecte : on identifie
+        # un événement par son URL source (ou son titre) et sa date.
+        return (alert.source.url or alert.title, alert.created_at)
+
+    def _is_significant(self, alert: BaseAlert) -> bool:
+        if getattr(alert, "tsunami_warning", False):
+            return True
+        return SEVERITY_ORDER.index(alert.severity) >= SEVERITY_ORDER.index(
+            self.severity_threshold
+        )
+
+    def record(
+        self,
+        name: str,
+        alerts: list[BaseAlert] | None,
+        now: datetime | None = None,
+    ) -> float:
+        """Met à jour l'intervalle d'une source après une collecte.
+
+        ``alerts`` vaut ``None`` si la collecte a échoué.
+        """
+        now = now or self.clock()
+        state = self._sources[name]
+        received = alerts or []
+        recent = [alert for alert in received if now - alert.created_at <= self.recent_window]
+        new = [alert for alert in recent if self._alert_key(alert) not in state.seen]
+
+        for alert in recent:
+            if self._is_significant(alert):
+                hot_until = alert.created_at + self.recent_window
+                if state.hot_until is None or hot_until > state.hot_until:
+                    state.hot_until = hot_until
+
+        if state.hot_until is not None and now < state.hot_until:
+            state.interval = self.min_interval
+        elif new:
+            base = min(state.interval, self.default_interval)
+            state.interval = self._clamp(base / self.backoff_factor)
+        else:
+            state.interval = self._clamp(state.interval * self.backoff_factor)
+
+        # Seuls les événements récents comptent comme « nouveaux »
+        state.seen = {
+            key for key in state.seen | {self._alert_key(alert) for alert in recent}
+            if now - key[1] <= self.recent_window
+        }
+        state.polls += 1
+        state.next_run = now + timedelta(seconds=state.interval)
+        return state.interval
+
+    async def poll(self, collector: BaseCollector) -> list[BaseAlert]:
+        """Exécute un collecteur et replanifie sa source."""
+        try:
+            alerts = await collector.collect_all()
+        except CollectorError as e:
+            logger.warning(f"Collecte {collector.name} en échec: {e}")
+            self.record(collector.name, None)
+            return []
+        interval = self.record(collector.name, alerts)
+        logger.debug(f"{collector.name}: prochain passage dans {interval:.0f}s")
+        return alerts
+
+    async def run_once(self) -> list[BaseAlert]:
+        """Exécute les collecteurs dus et retourne les alertes collectées."""
+        results = await asyncio.gather(*(self.poll(c) for c in self.due()))
+        return [alert for alerts in results for alert in alerts]
+
+    async def run(
+        self,
+        on_alerts: Callable[[list[BaseAlert]], None] | None = None,
+        stop: asyncio.Event | None = None,
+    ) -> None:
+        """Boucle de collecte jusqu'à ``stop``."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            alerts = await self.run_once()
+            if alerts and on_alerts:
+                on_alerts(alerts)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.next_delay())
+            except asyncio.TimeoutError:
+                pass
@@ -29,6 +29,8 @@ class Settings(BaseSettings):
 
     # Base de données
     database_url: str = "sqlite:///data/karukera.db"
+    storage_writable_months: int = 2
+    storage_late_arrival_days: int = 7
 
     # API
     api_host: str = "0.0.0.0"
@@ -40,6 +42,19 @@ class Settings(BaseSettings):
     collector_retry_count: int = 3
     collector_retry_delay: float = 1.0
 
+    # Disjoncteur des sources
+    circuit_failure_threshold: int = 3
+    circuit_cooldown: float = 120.0
+    circuit_probe_ttl: float = 60.0
+
+    # Planification adaptative (secondes)
+    scheduler_default_interval: float = 300.0
+    scheduler_min_interval: float = 60.0
+    scheduler_max_interval: float = 600.0
+    scheduler_backoff_factor: float = 2.0
+    scheduler_recent_window: float = 10800.0
+    scheduler_severity_threshold: str = "warning"
+
     # USGS
     usgs_api_url: str = "https://earthquake.usgs.gov/fdsnws/event/1/query"
     usgs_min_magnitude: float = 2.0
@@ -48,6 +48,3 @@ class BaseAlert(BaseModel):
     def affects_commune(self, commune: str) -> bool:
         """Vérifie si l'alerte concerne une commune."""
         return commune.lower() in [c.lower() for c in self.location.communes]
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
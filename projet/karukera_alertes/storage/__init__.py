@@ -1,11 +1,23 @@
 """Export du stockage."""
 
 from .sqlite_store import SQLiteStore
+from .partitioned_store import PartitionedSQLiteStore
+from .codecs import AlertCodec, JSONCodec, MsgpackCodec, get_codec
 
 def get_repository(backend: str = "sqlite"):
     """Factory pour obtenir un repository."""
     if backend == "sqlite":
         return SQLiteStore()
+    if backend == "sqlite-partitioned":
+        return PartitionedSQLiteStore()
     raise ValueError(f"Backend inconnu: {backend}")
 
-__all__ = ["SQLiteStore", "get_repository"]
+__all__ = [
+    "SQLiteStore",
+    "PartitionedSQLiteStore",
+    "AlertCodec",
+    "JSONCodec",
+    "MsgpackCodec",
+    "get_codec",
+    "get_repository",
+]
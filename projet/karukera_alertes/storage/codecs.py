@@ -0,0 +1,223 @@
+"""Codecs de sérialisation des alertes.
+
+Le codec JSON sérialise directement via pydantic-core (``to_json`` /
+``validate_json``). Les métadonnées libres passent par ``dumps``/``loads``,
+qui utilisent ``orjson`` s'il est installé (repli sur ``json``). Le codec
+msgpack, destiné au cache interne et au bus, nécessite ``msgpack``.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+from karukera_alertes.models import AlertType, BaseAlert, EarthquakeAlert
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    msgpack = None
+
+
+# Modèle concret à utiliser pour chaque type d'alerte
+ALERT_MODELS: dict[str, type[BaseAlert]] = {
+    AlertType.EARTHQUAKE.value: EarthquakeAlert,
+}
+
+
+if orjson is not None:
+    # dumps() : les dates passent par _default pour produire le même texte
+    # qu'avec json (métadonnées stockées en base)
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _default(value: Any) -> Any:
+    """Types non natifs JSON : dates en ISO 8601, erreur pour le reste."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type non sérialisable en JSON: {type(value).__name__}")
+
+
+def _json_bytes(data: Any) -> bytes:
+    """JSON compact identique avec orjson ou json."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(
+        data, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def dumps(data: Any) -> str:
+    """Sérialise en texte JSON (orjson si disponible)."""
+    return _json_bytes(data).decode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Désérialise du JSON (orjson si disponible)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _AlertHeader(BaseModel):
+    """Lecture du seul type d'une alerte JSON, pour choisir son modèle."""
+
+    type: str | None = None
+
+
+_HEADER = TypeAdapter(_AlertHeader)
+
+
+class ModelEncoder:
+    """Encodeur précompilé pour un modèle Pydantic.
+
+    Réutilise directement le sérialiseur et le validateur compilés
+    (pydantic-core) du modèle, sans repasser par ``model_dump``.
+    """
+
+    def __init__(self, model: type[BaseModel], mode: str = "python"):
+        self.model = model
+        self.mode = mode
+        self._serializer = model.__pydantic_serializer__
+        self._validator = model.__pydantic_validator__
+
+    def to_dict(self, obj: BaseModel) -> dict[str, Any]:
+        return self._serializer.to_python(obj, mode=self.mode)
+
+    def from_dict(self, data: dict[str, Any]) -> BaseModel:
+        return self._validator.validate_python(data)
+
+    def to_json(self, obj: BaseModel) -> bytes:
+        return self._serializer.to_json(obj)
+
+    def from_json(self, data: bytes) -> BaseModel:
+        return self._validator.validate_json(data)
+
+
+class AlertCodec(ABC):
+    """Codec de base : dict <-> bytes, avec encodeurs par modèle."""
+
+    name = "base"
+    content_type = "application/octet-stream"
+    # "python" conserve les datetime, "json" les convertit en chaînes ISO
+    dump_mode = "python"
+
+    def __init__(self) -> None:
+        self._encoders: dict[type[BaseModel], ModelEncoder] = {}
+
+    def encoder_for(self, model: type[BaseModel]) -> ModelEncoder:
+        """Retourne (et met en cache) l'encodeur d'un modèle."""
+        encoder = self._encoders.get(model)
+        if encoder is None:
+            encoder = self._encoders[model] = ModelEncoder(model, self.dump_mode)
+        return encoder
+
+    @abstractmethod
+    def _pack(self, data: Any) -> bytes:
+        """Sérialise une structure Python."""
+        pass
+
+    @abstractmethod
+    def _unpack(self, data: bytes) -> Any:
+        """Désérialise une structure Python."""
+        pass
+
+    def _to_dict(self, alert: BaseAlert) -> dict[str, Any]:
+        return self.encoder_for(type(alert)).to_dict(alert)
+
+    def _from_dict(self, data: dict[str, Any]) -> BaseAlert:
+        model = ALERT_MODELS.get(data.get("type"), BaseAlert)
+        return self.encoder_for(model).from_dict(data)
+
+    def encode(self, alert: BaseAlert) -> bytes:
+        """Encode une alerte."""
+        return self._pack(self._to_dict(alert))
+
+    def decode(self, data: bytes) -> BaseAlert:
+        """Décode une alerte selon son type."""
+        return self._from_dict(self._unpack(data))
+
+    def encode_many(self, alerts: list[BaseAlert]) -> bytes:
+        """Encode une liste d'alertes."""
+        return self._pack([self._to_dict(alert) for alert in alerts])
+
+    def decode_many(self, data: bytes) -> list[BaseAlert]:
+        """Décode une liste d'alertes."""
+        return [self._from_dict(item) for item in self._unpack(data)]
+
+
+class JSONCodec(AlertCodec):
+    """Codec JSON, sérialisé et validé directement par pydantic-core.
+
+    Sans structure Python intermédiaire : seul le champ ``type`` est lu
+    avant la validation par le modèle correspondant. Les listes sont
+    analysées une seule fois puis validées alerte par alerte (une validation
+    ``list[...]`` par pydantic-core est plus lente).
+    """
+
+    name = "json"
+    content_type = "application/json"
+    dump_mode = "json"
+
+    def _pack(self, data: Any) -> bytes:
+        return _json_bytes(data)
+
+    def _unpack(self, data: bytes) -> Any:
+        return loads(data)
+
+    def encode(self, alert: BaseAlert) -> bytes:
+        return self.encoder_for(type(alert)).to_json(alert)
+
+    def decode(self, data: bytes) -> BaseAlert:
+        model = ALERT_MODELS.get(_HEADER.validate_json(data).type, BaseAlert)
+        return self.encoder_for(model).from_json(data)
+
+    def encode_many(self, alerts: list[BaseAlert]) -> bytes:
+        return b"[" + b",".join(self.encode(alert) for alert in alerts) + b"]"
+
+
+class MsgpackCodec(AlertCodec):
+    """Codec msgpack pour le cache interne et le bus."""
+
+    name = "msgpack"
+    content_type = "application/msgpack"
+    dump_mode = "json"
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError("Le codec msgpack nécessite le paquet 'msgpack'")
+        super().__init__()
+        self._packer = msgpack.Packer()
+
+    def _pack(self, data: Any) -> bytes:
+        return self._packer.pack(data)
+
+    def _unpack(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+CODECS: dict[str, type[AlertCodec]] = {
+    JSONCodec.name: JSONCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(name: str = "json") -> AlertCodec:
+    """Factory pour obtenir un codec."""
+    if name not in CODECS:
+        raise ValueError(f"Codec inconnu: {name}")
+    return CODECS[name]()
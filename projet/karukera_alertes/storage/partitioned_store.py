@@ -0,0 +1,276 @@
+"""Stockage SQLite partitionné par mois."""
+
+import sqlite3
+from pathlib import Path
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from typing import Callable, Iterator, Any
+
+from karukera_alertes.models import BaseAlert
+from karukera_alertes.config import settings
+
+from .sqlite_store import SQLiteStore, _fetch_dicts
+
+Month = tuple[int, int]
+
+
+class PartitionedSQLiteStore:
+    """Stockage SQLite avec un fichier par mois.
+
+    Les lectures sont routées vers les seules partitions couvertes par la
+    plage temporelle demandée, attachées (``ATTACH``) à une connexion en
+    mémoire. Les partitions plus anciennes que la fenêtre d'écriture sont
+    ouvertes en lecture seule et peuvent être compactées.
+
+    Un mois reste inscriptible tant qu'il contient des dates de la fenêtre
+    de collecte (``late_arrival_days``, le ``days_back`` des collecteurs) :
+    les événements collectés en retard début de mois sont acceptés.
+    """
+
+    # Limite par défaut de SQLite (SQLITE_MAX_ATTACHED)
+    MAX_ATTACHED = 10
+    FILE_PREFIX = "alerts_"
+    # PRAGMA user_version d'une partition déjà compactée
+    COMPACTED_VERSION = 1
+
+    def __init__(
+        self,
+        partitions_dir: Path | str | None = None,
+        writable_months: int | None = None,
+        late_arrival_days: int | None = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.partitions_dir = (
+            Path(partitions_dir) if partitions_dir else settings.data_dir / "partitions"
+        )
+        self.writable_months = (
+            writable_months if writable_months is not None else settings.storage_writable_months
+        )
+        self.late_arrival_days = (
+            late_arrival_days if late_arrival_days is not None
+            else settings.storage_late_arrival_days
+        )
+        if self.writable_months < 1:
+            raise ValueError(f"writable_months doit être >= 1: {self.writable_months}")
+        if self.late_arrival_days < 0:
+            raise ValueError(f"late_arrival_days doit être >= 0: {self.late_arrival_days}")
+        self.clock = clock
+        self.partitions_dir.mkdir(parents=True, exist_ok=True)
+        self._stores: dict[Month, SQLiteStore] = {}
+
+    # Partitions
+
+    @staticmethod
+    def _month_of(dt: datetime) -> Month:
+        return (dt.year, dt.month)
+
+    @staticmethod
+    def _month_index(month: Month) -> int:
+        return month[0] * 12 + month[1] - 1
+
+    def _partition_path(self, month: Month) -> Path:
+        return self.partitions_dir / f"{self.FILE_PREFIX}{month[0]:04d}_{month[1]:02d}.db"
+
+    def partitions(self) -> list[Month]:
+        """Liste les mois existants, du plus récent au plus ancien."""
+        months = []
+        for path in self.partitions_dir.glob(f"{self.FILE_PREFIX}*.db"):
+            try:
+                year, month = path.stem.removeprefix(self.FILE_PREFIX).split("_")
+                months.append((int(year), int(month)))
+            except ValueError:
+                continue
+        return sorted(months, reverse=True)
+
+    def is_read_only(self, month: Month) -> bool:
+        """Une partition hors de la fenêtre d'écriture est en lecture seule."""
+        now = self.clock()
+        index = self._month_index(month)
+        if self._month_index(self._month_of(now)) - index < self.writable_months:
+            return False
+        oldest_collected = now - timedelta(days=self.late_arrival_days)
+        return index < self._month_index(self._month_of(oldest_collected))
+
+    def _store_for(self, month: Month) -> SQLiteStore:
+        read_only = self.is_read_only(month)
+        store = self._stores.get(month)
+        if store is None or store.read_only != read_only:
+            store = self._stores[month] = SQLiteStore(
+                self._partition_path(month), read_only=read_only
+            )
+        return store
+
+    def _select_partitions(self, start: datetime | None, end: datetime | None) -> list[Month]:
+        """Partitions existantes touchées par la plage [start, end]."""
+        months = self.partitions()
+        if start:
+            months = [m for m in months if m >= self._month_of(start)]
+        if end:
+            months = [m for m in months if m <= self._month_of(end)]
+        return months
+
+    @staticmethod
+    def _time_filter(start: datetime | None, end: datetime | None) -> tuple[str, list[Any]]:
+        clauses, params = [], []
+        if start:
+            clauses.append("created_at >= ?")
+            params.append(start.isoformat())
+        if end:
+            clauses.append("created_at <= ?")
+            params.append(end.isoformat())
+        return " AND ".join(clauses), params
+
+    @contextmanager
+    def _attached(self, months: list[Month]) -> Iterator[tuple[sqlite3.Connection, str]]:
+        """Attache les partitions et expose leur union sous forme de sous-requête."""
+        conn = sqlite3.connect("file::memory:", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            selects = []
+            for i, month in enumerate(months):
+                uri = self._partition_path(month).resolve().as_uri()
+                if self.is_read_only(month):
+                    uri += "?mode=ro"
+                conn.execute(f"ATTACH DATABASE ? AS p{i}", (uri,))
+                selects.append(self._select_columns(conn, f"p{i}"))
+            yield conn, f"({' UNION ALL '.join(selects)})"
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _select_columns(conn: sqlite3.Connection, alias: str) -> str:
+        """SELECT à colonnes explicites, NULL pour les colonnes absentes."""
+        # Une partition en lecture seule n'est pas migrée : elle peut être
+        # antérieure aux colonnes typées.
+        existing = {row["name"] for row in conn.execute(f"PRAGMA {alias}.table_info(alerts)")}
+        columns = ", ".join(
+            column if column in existing else f"NULL AS {column}"
+            for column in SQLiteStore.COLUMNS
+        )
+        return f"SELECT {columns} FROM {alias}.alerts"
+
+    def _chunks(self, months: list[Month]) -> Iterator[list[Month]]:
+        for i in range(0, len(months), self.MAX_ATTACHED):
+            yield months[i:i + self.MAX_ATTACHED]
+
+    # Repository
+
+    def save(self, alert: BaseAlert) -> None:
+        """Sauvegarde une alerte dans la partition de son mois de création."""
+        month = self._month_of(alert.created_at)
+        if self.is_read_only(month):
+            raise ValueError(f"Partition en lecture seule: {month[0]:04d}-{month[1]:02d}")
+        self._store_for(month).save(alert)
+
+    def get_by_id(self, alert_id: str) -> dict | None:
+        for month in self.partitions():
+            row = self._store_for(month).get_by_id(alert_id)
+            if row:
+                return row
+        return None
+
+    def get_active(
+        self,
+        alert_type: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[dict]:
+        # Les partitions sont disjointes dans le temps : en les parcourant du
+        # plus récent au plus ancien, les résultats restent triés.
+        results: list[dict] = []
+        remaining = limit + offset
+        time_clause, time_params = self._time_filter(start, end)
+        for chunk in self._chunks(self._select_partitions(start, end)):
+            if remaining <= 0:
+                break
+            with self._attached(chunk) as (conn, alerts):
+                query = f"SELECT * FROM {alerts} WHERE is_active = 1"
+                params: list[Any] = []
+                if alert_type:
+                    query += " AND type = ?"
+                    params.append(alert_type)
+                if time_clause:
+                    query += f" AND {time_clause}"
+                    params.extend(time_params)
+                query += " ORDER BY created_at DESC LIMIT ?"
+                params.append(remaining)
+                rows = _fetch_dicts(conn.execute(query, params))
+            results.extend(rows)
+            remaining -= len(rows)
+        return results[offset:offset + limit]
+
+    def count(
+        self,
+        alert_type: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> int:
+        total = 0
+        time_clause, time_params = self._time_filter(start, end)
+        for chunk in self._chunks(self._select_partitions(start, end)):
+            with self._attached(chunk) as (conn, alerts):
+                clauses, params = [], []
+                if alert_type:
+                    clauses.append("type = ?")
+                    params.append(alert_type)
+                if time_clause:
+                    clauses.append(time_clause)
+                    params.extend(time_params)
+                query = f"SELECT COUNT(*) FROM {alerts}"
+                if clauses:
+                    query += " WHERE " + " AND ".join(clauses)
+                total += conn.execute(query, params).fetchone()[0]
+        return total
+
+    def get_stats(self, start: datetime | None = None, end: datetime | None = None) -> dict:
+        stats: dict[str, Any] = {"total": 0, "by_type": {}, "by_severity": {}}
+        time_clause, params = self._time_filter(start, end)
+        where = f" WHERE {time_clause}" if time_clause else ""
+        for chunk in self._chunks(self._select_partitions(start, end)):
+            with self._attached(chunk) as (conn, alerts):
+                stats["total"] += conn.execute(
+                    f"SELECT COUNT(*) FROM {alerts}{where}", params
+                ).fetchone()[0]
+                for column, key in (("type", "by_type"), ("severity", "by_severity")):
+                    query = (
+                        f"SELECT {column}, COUNT(*) as count FROM {alerts}{where} GROUP BY {column}"
+                    )
+                    for row in conn.execute(query, params):
+                        stats[key][row[column]] = stats[key].get(row[column], 0) + row["count"]
+        return stats
+
+    # Maintenance
+
+    def compact(self) -> list[Month]:
+        """Compacte (VACUUM) les partitions en lecture seule pas encore compactées.
+
+        Le schéma de la partition est mis à jour au passage, puis la partition
+        est marquée (``PRAGMA user_version``) pour ne plus être réécrite.
+        """
+        compacted = []
+        for month in self.partitions():
+            if not self.is_read_only(month) or self.is_compacted(month):
+                continue
+            path = self._partition_path(month)
+            SQLiteStore(path)
+            conn = sqlite3.connect(path)
+            try:
+                conn.execute("PRAGMA optimize")
+                conn.execute(f"PRAGMA user_version = {self.COMPACTED_VERSION}")
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+            self._stores.pop(month, None)
+            compacted.append(month)
+        return compacted
+
+    def is_compacted(self, month: Month) -> bool:
+        """Indique si une partition a déjà été compactée."""
+        uri = f"{self._partition_path(month).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0] >= self.COMPACTED_VERSION
+        finally:
+            conn.close()
@@ -1,15 +1,52 @@
 """Stockage SQLite."""
 
 import sqlite3
-import json
+from enum import Enum
 from pathlib import Path
 from datetime import datetime
 from contextlib import contextmanager
-from typing import Iterator, Any
+from types import NoneType
+from typing import Iterator, Any, get_args
 
 from karukera_alertes.models import BaseAlert
 from karukera_alertes.config import settings
 
+from .codecs import ALERT_MODELS, dumps
+
+SQL_TYPES: dict[type, str] = {bool: "INTEGER", int: "INTEGER", float: "REAL", str: "TEXT"}
+
+
+def _typed_columns() -> dict[str, str]:
+    """Colonnes des champs propres aux sous-types enregistrés dans ALERT_MODELS.
+
+    Les types non scalaires sont stockés en JSON (TEXT).
+    """
+    columns: dict[str, str] = {}
+    for model in ALERT_MODELS.values():
+        for name, info in model.model_fields.items():
+            if name in BaseAlert.model_fields or name in columns:
+                continue
+            args = [arg for arg in get_args(info.annotation) if arg is not NoneType]
+            annotation = args[0] if len(args) == 1 else info.annotation
+            columns[name] = SQL_TYPES.get(annotation, "TEXT")
+    return columns
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Lignes restantes d'un curseur sous forme de dicts."""
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _column_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (dict, list)):
+        return dumps(value)
+    return value
+
 
 class SQLiteStore:
     """Stockage SQLite pour les alertes."""
@@ -34,20 +71,51 @@ class SQLiteStore:
     );
     CREATE INDEX IF NOT EXISTS idx_alerts_type ON alerts(type);
     CREATE INDEX IF NOT EXISTS idx_alerts_active ON alerts(is_active);
+    CREATE INDEX IF NOT EXISTS idx_alerts_created ON alerts(created_at);
     """
 
-    def __init__(self, db_path: Path | str | None = None):
+    # Champs spécifiques aux sous-types, persistés en colonnes (NULL sinon).
+    # Ajoutées par _migrate, dans l'ordre du registre, aux bases neuves comme
+    # aux bases existantes.
+    TYPED_COLUMNS: dict[str, str] = _typed_columns()
+
+    COLUMNS = (
+        "id", "type", "severity", "title", "description", "source_name", "source_url",
+        "created_at", "updated_at", "expires_at", "is_active",
+        "latitude", "longitude", "region", "metadata", *TYPED_COLUMNS,
+    )
+
+    INSERT = (
+        f"INSERT OR REPLACE INTO alerts ({', '.join(COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(COLUMNS))})"
+    )
+
+    def __init__(self, db_path: Path | str | None = None, read_only: bool = False):
         self.db_path = Path(db_path) if db_path else settings.data_dir / "karukera.db"
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        self.read_only = read_only
+        # En lecture seule : ni création de fichier ni modification du schéma
+        if not read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
 
     def _init_db(self) -> None:
         with self._get_connection() as conn:
             conn.executescript(self.SCHEMA)
+            self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Ajoute les colonnes typées absentes d'une base existante."""
+        existing = {row["name"] for row in conn.execute("PRAGMA table_info(alerts)")}
+        for column, sql_type in self.TYPED_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE alerts ADD COLUMN {column} {sql_type}")
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path)
+        if self.read_only:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -61,27 +129,29 @@ class SQLiteStore:
     def save(self, alert: BaseAlert) -> None:
         """Sauvegarde une alerte."""
         with self._get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO alerts
-                (id, type, severity, title, description, source_name, source_url,
-                 created_at, updated_at, expires_at, is_active,
-                 latitude, longitude, region, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                alert.id, alert.type.value, alert.severity.value,
-                alert.title, alert.description,
-                alert.source.name, alert.source.url,
-                alert.created_at.isoformat(), alert.updated_at.isoformat(),
-                alert.expires_at.isoformat() if alert.expires_at else None,
-                int(alert.is_active),
-                alert.location.latitude, alert.location.longitude,
-                alert.location.region, json.dumps(alert.metadata)
-            ))
+            conn.execute(self.INSERT, self._to_row(alert))
+
+    def _to_row(self, alert: BaseAlert) -> tuple:
+        typed = []
+        for column in self.TYPED_COLUMNS:
+            typed.append(_column_value(getattr(alert, column, None)))
+        return (
+            alert.id, alert.type.value, alert.severity.value,
+            alert.title, alert.description,
+            alert.source.name, alert.source.url,
+            alert.created_at.isoformat(), alert.updated_at.isoformat(),
+            alert.expires_at.isoformat() if alert.expires_at else None,
+            int(alert.is_active),
+            alert.location.latitude, alert.location.longitude,
+            alert.location.region, dumps(alert.metadata),
+            *typed,
+        )
 
     def get_by_id(self, alert_id: str) -> dict | None:
         with self._get_connection() as conn:
-            row = conn.execute("SELECT * FROM alerts WHERE id = ?", (alert_id,)).fetchone()
-            return dict(row) if row else None
+            cursor = conn.execute("SELECT * FROM alerts WHERE id = ?", (alert_id,))
+            rows = _fetch_dicts(cursor)
+            return rows[0] if rows else None
 
     def get_active(self, alert_type: str | None = None, limit: int = 100, offset: int = 0) -> list[dict]:
         with self._get_connection() as conn:
@@ -92,7 +162,7 @@ class SQLiteStore:
                 params.append(alert_type)
             query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
             params.extend([limit, offset])
-            return [dict(row) for row in conn.execute(query, params).fetchall()]
+            return _fetch_dicts(conn.execute(query, params))
 
     def count(self, alert_type: str | None = None) -> int:
         with self._get_connection() as conn:
@@ -0,0 +1,61 @@
+"""Fixtures pytest partagées."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from karukera_alertes.models import AlertSource, EarthquakeAlert, Location
+
+
+@pytest.fixture
+def sample_location():
+    """Location de test."""
+    return Location(
+        latitude=16.27,
+        longitude=-61.50,
+        communes=["Les Abymes", "Pointe-à-Pitre"],
+        region="Grande-Terre"
+    )
+
+
+@pytest.fixture
+def make_earthquake(sample_location):
+    """Fabrique d'alertes sismiques de test."""
+    def _make(
+        created_at: datetime | None = None,
+        magnitude: float = 3.0,
+        url: str = "http://test.com",
+        **kwargs,
+    ) -> EarthquakeAlert:
+        return EarthquakeAlert(
+            title=f"Séisme test M{magnitude:.1f}",
+            source=AlertSource(name="Test", url=url),
+            location=sample_location,
+            created_at=created_at or datetime.utcnow(),
+            magnitude=magnitude,
+            depth_km=10.0,
+            **kwargs,
+        )
+    return _make
+
+
+LEGACY_SCHEMA = """
+CREATE TABLE alerts (
+    id TEXT PRIMARY KEY, type TEXT NOT NULL, severity TEXT NOT NULL,
+    title TEXT NOT NULL, description TEXT DEFAULT '', source_name TEXT NOT NULL,
+    source_url TEXT DEFAULT '', created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+    expires_at TEXT, is_active INTEGER DEFAULT 1, latitude REAL, longitude REAL,
+    region TEXT DEFAULT '', metadata TEXT DEFAULT '{}'
+);
+"""
+
+
+@pytest.fixture
+def create_legacy_db():
+    """Crée une base antérieure à l'ajout des colonnes typées."""
+    def _create(path):
+        conn = sqlite3.connect(path)
+        conn.executescript(LEGACY_SCHEMA)
+        conn.close()
+    return _create
@@ -0,0 +1,246 @@
+"""Tests du disjoncteur des sources."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from karukera_alertes.collectors import (
+    BaseCollector,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    CollectorError,
+    breaker_stats,
+    get_breaker,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCollector(BaseCollector):
+    """Collecteur dont le comportement est piloté par le test."""
+
+    def __init__(self):
+        super().__init__()
+        self.fail = True
+        self.hang = False
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "fake-breaker"
+
+    @property
+    def source_url(self) -> str:
+        return "http://test.com"
+
+    async def collect(self):
+        self.calls += 1
+        if self.hang:
+            await asyncio.sleep(10)
+        if self.fail:
+            raise RuntimeError("source indisponible")
+        return
+        yield
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("test", failure_threshold=3, cooldown=60, probe_ttl=30, clock=clock)
+
+
+@pytest.fixture
+def collector(clock):
+    shared = get_breaker("fake-breaker")
+    shared.reset()
+    shared.failure_threshold, shared.cooldown, shared.probe_ttl = 3, 60, 30
+    shared.clock = clock
+    return FakeCollector()
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_threshold(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+    assert breaker.trips == 1
+
+
+def test_rejects_invalid_threshold():
+    with pytest.raises(ValueError):
+        CircuitBreaker("test", failure_threshold=0)
+
+
+def test_probe_success_only_closes_half_open(breaker, clock):
+    breaker.record_failure()
+    breaker.record_probe_success()
+    assert breaker.failures == 1
+
+    trip(breaker)
+    clock.now = 60
+    breaker.record_probe_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 0
+
+
+def test_success_resets_failure_count(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_single_trial_then_close(breaker, clock):
+    trip(breaker)
+    clock.now = 59
+    assert breaker.state == CircuitState.OPEN
+
+    clock.now = 60
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+    assert breaker.trips == 1
+
+
+def test_half_open_failure_reopens_and_counts_trip(breaker, clock):
+    trip(breaker)
+    clock.now = 60
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trips == 2
+    clock.now = 119
+    assert not breaker.allow_request()
+    clock.now = 120
+    assert breaker.allow_request()
+
+
+def test_stale_trial_is_replaced_after_cooldown(breaker, clock):
+    trip(breaker)
+    clock.now = 60
+    assert breaker.allow_request()
+
+    clock.now = 119
+    assert not breaker.allow_request()
+    clock.now = 120
+    assert breaker.allow_request()
+
+
+def test_probe_cache_expires_after_ttl(breaker, clock):
+    assert breaker.cached_probe() is None
+    breaker.store_probe(True)
+    clock.now = 30
+    assert breaker.cached_probe() is True
+    clock.now = 31
+    assert breaker.cached_probe() is None
+
+
+def test_trip_invalidates_probe(breaker):
+    breaker.store_probe(True)
+    trip(breaker)
+    assert breaker.cached_probe() is None
+
+
+async def test_collect_all_short_circuits_when_open(collector):
+    for _ in range(3):
+        with pytest.raises(CollectorError):
+            await collector.collect_all()
+
+    with pytest.raises(CircuitOpenError):
+        await collector.collect_all()
+    assert collector.calls == 3
+    assert breaker_stats()["fake-breaker"]["state"] == "open"
+    assert breaker_stats()["fake-breaker"]["trips"] == 1
+
+
+async def test_cancelled_trial_does_not_block_breaker(collector, clock):
+    for _ in range(3):
+        with pytest.raises(CollectorError):
+            await collector.collect_all()
+
+    clock.now = 60
+    collector.hang = True
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(collector.collect_all(), 0.01)
+    assert collector.breaker.state == CircuitState.HALF_OPEN
+
+    collector.hang = False
+    collector.fail = False
+    assert await collector.collect_all() == []
+    assert collector.breaker.state == CircuitState.CLOSED
+
+
+async def test_is_available_caches_and_short_circuits(collector, clock, monkeypatch):
+    heads = []
+
+    async def fake_head(self, url, **kwargs):
+        heads.append(url)
+        return httpx.Response(503)
+
+    monkeypatch.setattr(httpx.AsyncClient, "head", fake_head)
+
+    assert await collector.is_available() is False
+    assert await collector.is_available() is False
+    assert len(heads) == 1
+
+    # Trois échecs ouvrent le circuit : plus aucune requête
+    for _ in range(2):
+        clock.now += 31
+        await collector.is_available()
+    assert collector.breaker.state == CircuitState.OPEN
+    clock.now += 31
+    assert await collector.is_available() is False
+    assert len(heads) == 3
+
+
+async def test_head_ok_does_not_hide_collect_failures(collector, clock, monkeypatch):
+    async def fake_head(self, url, **kwargs):
+        return httpx.Response(200)
+
+    monkeypatch.setattr(httpx.AsyncClient, "head", fake_head)
+    for _ in range(3):
+        clock.now += 31
+        assert await collector.is_available() is True
+        with pytest.raises(CollectorError):
+            await collector.collect_all()
+    assert collector.breaker.state == CircuitState.OPEN
+    assert collector.breaker.trips == 1
+
+
+async def test_cancelled_probe_releases_trial(collector, clock, monkeypatch):
+    async def hanging_head(self, url, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(httpx.AsyncClient, "head", hanging_head)
+    trip(collector.breaker)
+    clock.now = 60
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(collector.is_available(), 0.01)
+    assert collector.breaker.allow_request()
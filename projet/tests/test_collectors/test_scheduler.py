@@ -0,0 +1,157 @@
+"""Tests de la planification adaptative."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from karukera_alertes.collectors import (
+    AdaptiveScheduler,
+    BaseCollector,
+    EarthquakeCollector,
+    get_breaker,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+class VirtualClock:
+    def __init__(self, now: datetime = NOW):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+class FakeCollector(BaseCollector):
+    """Collecteur dont les réponses sont fournies par le test."""
+
+    def __init__(self, name: str = "fake-scheduler"):
+        self._name = name
+        super().__init__()
+        self.responses: list = []
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def source_url(self) -> str:
+        return "http://test.com"
+
+    async def collect(self):
+        self.calls += 1
+        response = self.responses.pop(0) if self.responses else []
+        if isinstance(response, Exception):
+            raise response
+        for alert in response:
+            yield alert
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def collector():
+    get_breaker("fake-scheduler").reset()
+    return FakeCollector()
+
+
+@pytest.fixture
+def scheduler(collector, clock):
+    return AdaptiveScheduler(
+        [collector],
+        min_interval=60,
+        max_interval=300,
+        default_interval=300,
+        backoff_factor=2,
+        recent_window=3600,
+        severity_threshold="warning",
+        clock=clock,
+    )
+
+
+def test_backoff_is_bounded_by_max_interval(scheduler, collector):
+    assert scheduler.intervals() == {collector.name: 300}
+    for _ in range(5):
+        assert scheduler.record(collector.name, []) == 300
+    assert scheduler.record(collector.name, None) == 300
+
+
+def test_significant_alert_keeps_min_interval_during_window(
+    scheduler, collector, clock, make_earthquake
+):
+    quake = make_earthquake(created_at=NOW, magnitude=4.6)
+    assert scheduler.record(collector.name, [quake]) == 60
+
+    # Réponses incrémentales vides : reste rapide tant que la fenêtre court
+    clock.advance(1800)
+    assert scheduler.record(collector.name, []) == 60
+
+    clock.advance(1801)
+    assert scheduler.record(collector.name, []) == 120
+    assert scheduler.record(collector.name, []) == 240
+    assert scheduler.record(collector.name, []) == 300
+
+
+def test_tsunami_warning_is_significant(scheduler, collector, make_earthquake):
+    alert = make_earthquake(created_at=NOW, magnitude=2.5, tsunami_warning=True)
+    assert scheduler.record(collector.name, [alert]) == 60
+
+
+def test_new_minor_alerts_speed_up_and_repeats_back_off(scheduler, collector, make_earthquake):
+    alert = make_earthquake(created_at=NOW, magnitude=2.5, url="http://test.com/1")
+    assert scheduler.record(collector.name, [alert]) == 150
+    # Même événement dans une réponse complète : inchangé
+    assert scheduler.record(collector.name, [alert]) == 300
+
+
+def test_old_alerts_are_not_activity(scheduler, collector, make_earthquake):
+    old = make_earthquake(created_at=NOW - timedelta(days=2), magnitude=5.5)
+    assert scheduler.record(collector.name, [old]) == 300
+
+
+async def test_run_once_polls_due_collectors(scheduler, collector, clock, make_earthquake):
+    collector.responses = [[make_earthquake(created_at=NOW, magnitude=4.2)], []]
+
+    alerts = await scheduler.run_once()
+    assert len(alerts) == 1
+    assert scheduler.due() == []
+    assert scheduler.next_delay() == 60
+
+    assert await scheduler.run_once() == []
+    assert collector.calls == 1
+
+    clock.advance(scheduler.next_delay())
+    assert await scheduler.run_once() == []
+    assert collector.calls == 2
+
+
+async def test_run_once_backs_off_on_failure(scheduler, collector, clock, make_earthquake):
+    collector.responses = [[make_earthquake(created_at=NOW, magnitude=2.5)], RuntimeError("down")]
+    await scheduler.run_once()
+    assert scheduler.interval(collector.name) == 150
+
+    clock.advance(150)
+    assert await scheduler.run_once() == []
+    assert scheduler.interval(collector.name) == 300
+
+
+def test_earthquake_collector_incremental_params():
+    collector = EarthquakeCollector()
+    collector.updated_after = NOW
+    assert "updatedafter" not in collector._build_params()
+
+    AdaptiveScheduler([collector])
+    assert collector._build_params()["updatedafter"] == "2026-01-01T12:00:00"
+
+
+def test_scheduler_can_keep_full_responses():
+    collector = EarthquakeCollector()
+    AdaptiveScheduler([collector], incremental=False)
+    assert not collector.incremental
@@ -0,0 +1,81 @@
+"""Tests des codecs de sérialisation."""
+
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from karukera_alertes.models import AlertSource, AlertType, BaseAlert, EarthquakeAlert
+from karukera_alertes.storage import codecs
+from karukera_alertes.storage.codecs import AlertCodec, dumps, get_codec
+
+METADATA = {
+    "event_id": "us7000abcd",
+    1: "clé entière",
+    "updated": datetime(2024, 1, 2, 3, 4, 5, 678),
+    "uuid": UUID(int=1),
+    "nested": {"values": [1, 2.5, None, True]},
+}
+EXPECTED = (
+    '{"event_id":"us7000abcd","1":"clé entière","updated":"2024-01-02T03:04:05.000678",'
+    '"uuid":"00000000-0000-0000-0000-000000000001","nested":{"values":[1,2.5,null,true]}}'
+)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Exécute le test avec orjson puis avec le repli json."""
+    if request.param == "orjson":
+        if codecs.orjson is None:
+            pytest.skip("orjson non installé")
+    else:
+        monkeypatch.setattr(codecs, "orjson", None)
+    return request.param
+
+
+def test_dumps_same_output_for_every_backend(backend):
+    assert dumps(METADATA) == EXPECTED
+
+
+def test_dumps_rejects_unknown_types(backend):
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_alert_codec_is_abstract():
+    with pytest.raises(TypeError):
+        AlertCodec()
+
+
+@pytest.mark.parametrize("name", ["json", "msgpack"])
+def test_roundtrip_keeps_subtype(name, make_earthquake):
+    if name == "msgpack" and codecs.msgpack is None:
+        pytest.skip("msgpack non installé")
+    codec = get_codec(name)
+    alert = make_earthquake(magnitude=5.1, felt_reports=12, tsunami_warning=True)
+
+    decoded = codec.decode(codec.encode(alert))
+    assert isinstance(decoded, EarthquakeAlert)
+    assert decoded.model_dump() == alert.model_dump()
+
+    many = codec.decode_many(codec.encode_many([alert, alert]))
+    assert [a.magnitude for a in many] == [5.1, 5.1]
+
+
+def test_json_codec_matches_pydantic_and_falls_back_to_base(make_earthquake, sample_location):
+    codec = get_codec("json")
+    alert = make_earthquake(magnitude=4.5)
+    assert codec.encode(alert) == alert.model_dump_json().encode()
+
+    other = BaseAlert(
+        type=AlertType.CYCLONE,
+        title="Vigilance cyclone",
+        source=AlertSource(name="Météo-France"),
+        location=sample_location,
+    )
+    decoded = codec.decode(codec.encode(other))
+    assert type(decoded) is BaseAlert
+    assert decoded.type == AlertType.CYCLONE
+
+    mixed = codec.decode_many(codec.encode_many([alert, other]))
+    assert [type(a) for a in mixed] == [EarthquakeAlert, BaseAlert]
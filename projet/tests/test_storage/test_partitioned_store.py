@@ -0,0 +1,172 @@
+"""Tests du stockage SQLite partitionné."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from karukera_alertes.config import settings
+from karukera_alertes.storage import PartitionedSQLiteStore, get_repository
+
+
+def months_ago(n: int, day: int = 15) -> datetime:
+    """Date au jour ``day`` du mois situé ``n`` mois avant le mois courant."""
+    now = datetime.utcnow()
+    index = now.year * 12 + now.month - 1 - n
+    return datetime(index // 12, index % 12 + 1, day, 12, 0)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PartitionedSQLiteStore(tmp_path / "partitions", writable_months=100)
+
+
+@pytest.fixture
+def attached_calls(store, monkeypatch):
+    """Enregistre les partitions attachées à chaque lecture."""
+    calls = []
+    original = store._attached
+
+    def spy(months):
+        calls.append(list(months))
+        return original(months)
+
+    monkeypatch.setattr(store, "_attached", spy)
+    return calls
+
+
+def test_factory_returns_partitioned_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    store = get_repository("sqlite-partitioned")
+    assert isinstance(store, PartitionedSQLiteStore)
+    assert store.partitions_dir == tmp_path / "partitions"
+
+
+@pytest.mark.parametrize("writable_months", [0, -1])
+def test_writable_window_must_include_current_month(tmp_path, writable_months):
+    with pytest.raises(ValueError):
+        PartitionedSQLiteStore(tmp_path, writable_months=writable_months)
+
+
+def test_late_arrivals_within_collection_window(tmp_path, make_earthquake):
+    now = datetime(2026, 3, 4, 12, 0)
+    store = PartitionedSQLiteStore(
+        tmp_path, writable_months=1, late_arrival_days=7, clock=lambda: now
+    )
+
+    # Février contient encore des dates de la fenêtre de collecte
+    late = make_earthquake(created_at=now - timedelta(days=7))
+    store.save(late)
+    assert store.get_by_id(late.id)["id"] == late.id
+
+    with pytest.raises(ValueError):
+        store.save(make_earthquake(created_at=datetime(2026, 1, 31, 12, 0)))
+
+    # Une fois la fenêtre passée, février devient en lecture seule
+    now = datetime(2026, 3, 9, 12, 0)
+    with pytest.raises(ValueError):
+        store.save(make_earthquake(created_at=datetime(2026, 2, 28, 12, 0)))
+
+
+def test_save_routes_to_month_partition(store, make_earthquake):
+    store.save(make_earthquake(created_at=months_ago(0)))
+    store.save(make_earthquake(created_at=months_ago(2)))
+    store.save(make_earthquake(created_at=months_ago(2, day=3)))
+
+    current, older = months_ago(0), months_ago(2)
+    assert store.partitions() == [
+        (current.year, current.month),
+        (older.year, older.month),
+    ]
+    assert store._partition_path((older.year, older.month)).exists()
+    assert store.count(start=months_ago(2, day=1), end=months_ago(2, day=28)) == 2
+
+
+def test_time_range_prunes_partitions(store, make_earthquake, attached_calls):
+    for n in range(6):
+        store.save(make_earthquake(created_at=months_ago(n)))
+
+    assert store.count(start=months_ago(3, day=1), end=months_ago(1, day=28)) == 3
+    expected = [(d.year, d.month) for d in (months_ago(1), months_ago(2), months_ago(3))]
+    assert attached_calls == [expected]
+
+    attached_calls.clear()
+    stats = store.get_stats(start=months_ago(0, day=1))
+    assert stats["total"] == 1
+    assert attached_calls == [[(months_ago(0).year, months_ago(0).month)]]
+
+
+def test_get_active_ordering_and_offset(store, make_earthquake):
+    dates = [months_ago(n, day=day) for n in range(4) for day in (20, 5)]
+    for created_at in reversed(dates):
+        store.save(make_earthquake(created_at=created_at))
+
+    rows = store.get_active(limit=3, offset=2)
+    assert [row["created_at"] for row in rows] == [d.isoformat() for d in dates[2:5]]
+
+    rows = store.get_active(limit=100, offset=6)
+    assert [row["created_at"] for row in rows] == [d.isoformat() for d in dates[6:]]
+
+
+def test_more_partitions_than_attach_limit(store, make_earthquake, attached_calls):
+    total = PartitionedSQLiteStore.MAX_ATTACHED * 2 + 5
+    for n in range(total):
+        store.save(make_earthquake(created_at=months_ago(n), magnitude=4.5))
+
+    assert store.count() == total
+    assert [len(chunk) for chunk in attached_calls] == [10, 10, 5]
+
+    stats = store.get_stats()
+    assert stats["total"] == total
+    assert stats["by_severity"] == {"warning": total}
+
+    rows = store.get_active(limit=total)
+    assert [row["created_at"] for row in rows] == [months_ago(n).isoformat() for n in range(total)]
+
+
+def test_read_only_partition_rejects_writes(tmp_path, make_earthquake):
+    old = make_earthquake(created_at=months_ago(3))
+    PartitionedSQLiteStore(tmp_path, writable_months=100).save(old)
+
+    store = PartitionedSQLiteStore(tmp_path, writable_months=2)
+    path = store._partition_path((old.created_at.year, old.created_at.month))
+    before = path.read_bytes()
+
+    with pytest.raises(ValueError):
+        store.save(make_earthquake(created_at=months_ago(3)))
+    assert store._store_for((old.created_at.year, old.created_at.month)).read_only
+    assert store.get_by_id(old.id)["id"] == old.id
+    assert store.get_active()[0]["id"] == old.id
+    assert path.read_bytes() == before
+
+
+def test_compact_only_read_only_partitions(tmp_path, make_earthquake):
+    writer = PartitionedSQLiteStore(tmp_path, writable_months=100)
+    for n in range(4):
+        writer.save(make_earthquake(created_at=months_ago(n)))
+
+    store = PartitionedSQLiteStore(tmp_path, writable_months=2)
+    compacted = store.compact()
+
+    assert compacted == [(d.year, d.month) for d in (months_ago(2), months_ago(3))]
+    assert all(store.is_compacted(month) for month in compacted)
+    assert store.count() == 4
+
+    # Les partitions déjà compactées ne sont plus réécrites
+    paths = [store._partition_path(month) for month in compacted]
+    before = [path.read_bytes() for path in paths]
+    assert store.compact() == []
+    assert [path.read_bytes() for path in paths] == before
+
+
+def test_legacy_read_only_partition_is_not_migrated(tmp_path, make_earthquake, create_legacy_db):
+    store = PartitionedSQLiteStore(tmp_path, writable_months=2)
+    old = months_ago(5)
+    path = store._partition_path((old.year, old.month))
+    create_legacy_db(path)
+    before = path.read_bytes()
+    store.save(make_earthquake(created_at=months_ago(0), magnitude=4.4))
+
+    rows = store.get_active()
+    assert [row["magnitude"] for row in rows] == [4.4]
+    assert store.count() == 1
+    assert path.read_bytes() == before
@@ -0,0 +1,44 @@
+"""Tests du stockage SQLite."""
+
+from karukera_alertes.storage import SQLiteStore
+
+
+def test_earthquake_fields_are_columns(tmp_path, make_earthquake):
+    store = SQLiteStore(tmp_path / "alerts.db")
+    alert = make_earthquake(magnitude=5.4, felt_reports=7, tsunami_warning=True)
+    store.save(alert)
+
+    row = store.get_by_id(alert.id)
+    assert row["magnitude"] == 5.4
+    assert row["depth_km"] == 10.0
+    assert row["felt_reports"] == 7
+    assert row["tsunami_warning"] == 1
+    assert row["metadata"] == "{}"
+
+
+def test_legacy_database_is_migrated(tmp_path, make_earthquake, create_legacy_db):
+    path = tmp_path / "legacy.db"
+    create_legacy_db(path)
+
+    store = SQLiteStore(path)
+    alert = make_earthquake(magnitude=4.2)
+    store.save(alert)
+    assert store.get_active()[0]["magnitude"] == 4.2
+
+
+def test_read_only_store_does_not_migrate(tmp_path, create_legacy_db):
+    path = tmp_path / "legacy.db"
+    create_legacy_db(path)
+    before = path.read_bytes()
+
+    store = SQLiteStore(path, read_only=True)
+    assert store.count() == 0
+    assert path.read_bytes() == before
+
+
+def test_typed_columns_follow_registered_models():
+    assert SQLiteStore.TYPED_COLUMNS["magnitude"] == "REAL"
+    assert SQLiteStore.TYPED_COLUMNS["felt_reports"] == "INTEGER"
+    assert SQLiteStore.TYPED_COLUMNS["tsunami_warning"] == "INTEGER"
+    assert SQLiteStore.TYPED_COLUMNS["intensity"] == "TEXT"
+    assert "title" not in SQLiteStore.TYPED_COLUMNS